@@ -2,19 +2,14 @@ import json
 import re
 from typing import Dict, List, Any, Optional
 from datetime import datetime
+from importlib.util import find_spec
 import os
 from dotenv import load_dotenv
 
-# Make AI libraries optional
-try:
-    import openai
-except ImportError:
-    openai = None
-
-try:
-    import anthropic
-except ImportError:
-    anthropic = None
+# Make AI libraries optional; probe for them without importing so the SDKs
+# are only loaded when a matching API key is configured
+OPENAI_AVAILABLE = find_spec('openai') is not None
+ANTHROPIC_AVAILABLE = find_spec('anthropic') is not None
 
 load_dotenv()
 
@@ -26,14 +21,16 @@ class ContentGenerator:
         self.anthropic_client = None
         
         # Only initialize if API keys are available
-        if openai and os.getenv('OPENAI_API_KEY'):
+        if OPENAI_AVAILABLE and os.getenv('OPENAI_API_KEY'):
             try:
+                import openai
                 self.openai_client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
             except:
                 pass
                 
-        if anthropic and os.getenv('ANTHROPIC_API_KEY'):
+        if ANTHROPIC_AVAILABLE and os.getenv('ANTHROPIC_API_KEY'):
             try:
+                import anthropic
                 self.anthropic_client = anthropic.Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
             except:
                 pass
@@ -73,29 +70,30 @@ class ContentGenerator:
             return self._generate_real_variations(topic, research_data)
         
         # Otherwise return demo variations
+        tag = f"#{topic.replace(' ', '')}"
         variations = [
             {
                 'type': 'professional',
-                'text': f"The latest research on {topic} reveals fascinating insights across multiple industry sources. Based on comprehensive analysis of trending discussions and expert opinions, key patterns are emerging that will shape how businesses approach this space.\n\n→ Growing momentum in practical applications\n→ Industry leaders sharing implementation strategies  \n→ Community discussions showing real-world impact\n→ Data-driven insights supporting adoption\n\nThe conversation has shifted from theoretical possibilities to tangible results. Organizations that understand these trends early will be positioned for competitive advantage.\n\nWhat trends are you seeing in your industry? Share your perspective below.\n\n#{topic.replace(' ', '')} #Innovation #BusinessTrends #TechInsights",
+                'text': f"The latest research on {topic} reveals fascinating insights across multiple industry sources. Based on comprehensive analysis of trending discussions and expert opinions, key patterns are emerging that will shape how businesses approach this space.\n\n→ Growing momentum in practical applications\n→ Industry leaders sharing implementation strategies  \n→ Community discussions showing real-world impact\n→ Data-driven insights supporting adoption\n\nThe conversation has shifted from theoretical possibilities to tangible results. Organizations that understand these trends early will be positioned for competitive advantage.\n\nWhat trends are you seeing in your industry? Share your perspective below.\n\n{tag} #Innovation #BusinessTrends #TechInsights",
                 'quality_score': 8.7,
                 'word_count': 124,
-                'hashtags': [f"#{topic.replace(' ', '')}", "#Innovation", "#BusinessTrends", "#TechInsights"],
+                'hashtags': [tag, "#Innovation", "#BusinessTrends", "#TechInsights"],
                 'sources': self._extract_sources(research_data)
             },
             {
                 'type': 'thought_leadership',
-                'text': f"Here's what most people miss about {topic}:\n\nEveryone's talking about the technology, but the real transformation happens at the intersection of human behavior and practical implementation.\n\nAfter analyzing discussions across major platforms, one pattern stands out: successful adoption isn't about having the best tools—it's about understanding the problem you're actually solving.\n\nThe organizations thriving in this space share three characteristics:\n• They start with customer pain points, not technology capabilities\n• They measure success by outcomes, not features  \n• They iterate based on real user feedback, not assumptions\n\nThe future belongs to those who can bridge the gap between what's possible and what's practical.\n\nWhere do you see the biggest opportunities for impact?\n\n#ThoughtLeadership #{topic.replace(' ', '')} #Innovation #Strategy",
+                'text': f"Here's what most people miss about {topic}:\n\nEveryone's talking about the technology, but the real transformation happens at the intersection of human behavior and practical implementation.\n\nAfter analyzing discussions across major platforms, one pattern stands out: successful adoption isn't about having the best tools—it's about understanding the problem you're actually solving.\n\nThe organizations thriving in this space share three characteristics:\n• They start with customer pain points, not technology capabilities\n• They measure success by outcomes, not features  \n• They iterate based on real user feedback, not assumptions\n\nThe future belongs to those who can bridge the gap between what's possible and what's practical.\n\nWhere do you see the biggest opportunities for impact?\n\n#ThoughtLeadership {tag} #Innovation #Strategy",
                 'quality_score': 9.1,
                 'word_count': 147,
-                'hashtags': ["#ThoughtLeadership", f"#{topic.replace(' ', '')}", "#Innovation", "#Strategy"],
+                'hashtags': ["#ThoughtLeadership", tag, "#Innovation", "#Strategy"],
                 'sources': self._extract_sources(research_data)
             },
             {
                 'type': 'conversational',
-                'text': f"Been diving deep into {topic} research today and wow... 🤯\n\nThe amount of innovation happening right now is incredible. Just spent hours analyzing discussions across tech communities, and the consensus is clear: we're at a tipping point.\n\nWhat started as experimental projects are becoming business-critical solutions. The early adopters aren't just testing anymore—they're scaling.\n\nPersonally, I'm most excited about the practical applications. Less sci-fi, more \"this actually solves my Tuesday morning problem.\"\n\nAnyone else feeling like we're living through a major shift? What's got your attention?\n\n#{topic.replace(' ', '')} #TechTrends #Innovation",
+                'text': f"Been diving deep into {topic} research today and wow... 🤯\n\nThe amount of innovation happening right now is incredible. Just spent hours analyzing discussions across tech communities, and the consensus is clear: we're at a tipping point.\n\nWhat started as experimental projects are becoming business-critical solutions. The early adopters aren't just testing anymore—they're scaling.\n\nPersonally, I'm most excited about the practical applications. Less sci-fi, more \"this actually solves my Tuesday morning problem.\"\n\nAnyone else feeling like we're living through a major shift? What's got your attention?\n\n{tag} #TechTrends #Innovation",
                 'quality_score': 8.4,
                 'word_count': 108,
-                'hashtags': [f"#{topic.replace(' ', '')}", "#TechTrends", "#Innovation"],
+                'hashtags': [tag, "#TechTrends", "#Innovation"],
                 'sources': self._extract_sources(research_data)
             }
         ]
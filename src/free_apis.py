@@ -424,18 +424,7 @@ Format as JSON for easy parsing."""
     
     def can_use_live_research(self) -> bool:
         """Check if any APIs are available for live research"""
-        available_apis = []
-        
-        if self.gemini_model and self.check_daily_limit('gemini'):
-            available_apis.append('gemini')
-        
-        if self.hf_client and self.check_daily_limit('huggingface'):
-            available_apis.append('huggingface')
-        
-        if self.anthropic_client and self.check_daily_limit('anthropic'):
-            available_apis.append('anthropic')
-        
-        return len(available_apis) > 0
+        return len(self.get_available_apis()) > 0
     
     def get_usage_stats(self) -> Dict[str, int]:
         """Get current usage statistics"""
@@ -495,11 +484,14 @@ Format as JSON for easy parsing."""
     
     def health_check(self) -> Dict[str, Any]:
         """Check API health and availability"""
+        # Each availability check queries usage per API, so resolve it once
+        available_apis = self.get_available_apis()
+        
         health = {
-            'apis_available': self.get_available_apis(),
+            'apis_available': available_apis,
             'total_apis': len([api for api in [self.gemini_model, self.hf_client, self.anthropic_client] if api]),
             'usage_stats': self.get_usage_stats(),
-            'can_research': self.can_use_live_research()
+            'can_research': len(available_apis) > 0
         }
         
         return health
@@ -3,9 +3,6 @@ import ssl
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
 import os
@@ -89,6 +86,10 @@ class MonitoringManager:
     
     def _show_analytics_dashboard(self):
         """Detailed analytics dashboard"""
+        # Charting libraries are imported lazily; pandas alone dominates cold start
+        import pandas as pd
+        import plotly.express as px
+        
         st.subheader("Usage Analytics")
         
         # Time range selector
@@ -135,6 +136,8 @@ class MonitoringManager:
     
     def _show_security_dashboard(self):
         """Security monitoring dashboard"""
+        import pandas as pd
+        
         st.subheader("Security Overview")
         
         health = self.security.check_system_health()
@@ -145,8 +148,7 @@ class MonitoringManager:
         
         if health.get('alerts'):
             st.warning("Security Alerts:")
-            for alert in health['alerts']:
-                st.write(f"- {alert}")
+            st.markdown("\n".join(f"- {alert}" for alert in health['alerts']))
         
         # Security metrics
         col1, col2 = st.columns(2)
@@ -185,6 +187,9 @@ class MonitoringManager:
     
     def _show_api_dashboard(self):
         """API usage monitoring"""
+        import pandas as pd
+        import plotly.express as px
+        
         st.subheader("API Usage Monitoring")
         
         # Current usage
@@ -256,6 +261,9 @@ class MonitoringManager:
     
     def _show_feedback_dashboard(self):
         """User feedback monitoring"""
+        import pandas as pd
+        import plotly.express as px
+        
         st.subheader("User Feedback Analysis")
         
         feedback_stats = self.db.get_feedback_stats(days=7)
@@ -344,11 +352,13 @@ class MonitoringManager:
             ("Email Configuration", bool(os.getenv('SMTP_EMAIL') and os.getenv('SMTP_PASSWORD')))
         ]
         
-        for check_name, status in config_checks:
-            if status:
-                st.success(f"✅ {check_name}")
-            else:
-                st.warning(f"⚠️ {check_name} not configured")
+        # One markdown element instead of one alert box per check, keeping the coloured status boxes
+        config_tiles = [
+            f'<div class="status-good">✅ {check_name}</div>' if status
+            else f'<div class="status-warning">⚠️ {check_name} not configured</div>'
+            for check_name, status in config_checks
+        ]
+        st.markdown("".join(config_tiles), unsafe_allow_html=True)
     
     def send_alert_email(self, subject: str, message: str, alert_type: str = "warning"):
         """Send alert email to admin"""
@@ -4,15 +4,12 @@ import json
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
-from bs4 import BeautifulSoup
+from importlib.util import find_spec
 import os
 from dotenv import load_dotenv
 
-# Make praw optional
-try:
-    import praw
-except ImportError:
-    praw = None
+# Make praw optional; probe for it without importing until Reddit is used
+PRAW_AVAILABLE = find_spec('praw') is not None
 
 load_dotenv()
 
@@ -30,9 +27,10 @@ class ResearchEngine:
         
     def _init_reddit(self) -> Optional:
         """Initialize Reddit client if credentials available"""
-        if praw is None:
+        if not PRAW_AVAILABLE:
             return None
         try:
+            import praw
             return praw.Reddit(
                 client_id=os.getenv('REDDIT_CLIENT_ID', ''),
                 client_secret=os.getenv('REDDIT_CLIENT_SECRET', ''),
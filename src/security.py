@@ -1,20 +1,61 @@
 import streamlit as st
+import functools
 import hashlib
 import hmac
 import time
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 import uuid
 from better_profanity import profanity
 import os
 
+_PROFANITY_LOADED = False
+
+def _ensure_profanity_loaded():
+    """Load the profanity wordlist once per process"""
+    global _PROFANITY_LOADED
+    if not _PROFANITY_LOADED:
+        profanity.load_censor_words()
+        _PROFANITY_LOADED = True
+
+@functools.lru_cache(maxsize=512)
+def _cached_safety_check(text: str) -> Tuple[str, Tuple[str, ...], str]:
+    """Run the safety checks once per distinct text, shared by all SecurityManager instances"""
+    issues = []
+    severity = 'safe'
+    text_lower = text.lower()
+    
+    # Profanity check
+    has_profanity = profanity.contains_profanity(text)
+    if has_profanity:
+        issues.append('Contains inappropriate language')
+        severity = 'warning'
+    
+    # Length check
+    if len(text) > 2000:
+        issues.append('Content too long')
+        severity = 'warning'
+    
+    # Basic spam detection
+    if SecurityManager._detect_spam_patterns(text, text_lower):
+        issues.append('Potential spam detected')
+        severity = 'warning'
+    
+    # Harmful content patterns
+    if SecurityManager._detect_harmful_content(text_lower):
+        issues.append('Potentially harmful content detected')
+        severity = 'blocked'
+    
+    sanitized_text = profanity.censor(text) if has_profanity else text
+    return severity, tuple(issues), sanitized_text
+
 class SecurityManager:
     """Handles authentication, rate limiting, and content safety"""
     
     def __init__(self, database_manager):
         self.db = database_manager
         self.admin_session_timeout = 3600  # 1 hour
-        profanity.load_censor_words()
+        _ensure_profanity_loaded()
         
     def create_admin_session(self, password: str) -> bool:
         """Create admin session with timeout"""
@@ -22,7 +63,8 @@ class SecurityManager:
         
         if self.verify_password(password, correct_password):
             session_id = str(uuid.uuid4())
-            expires_at = datetime.now() + timedelta(seconds=self.admin_session_timeout)
+            # Monotonic seconds: cheap to compare on every rerun and immune to clock changes
+            expires_at = time.monotonic() + self.admin_session_timeout
             
             st.session_state.admin_session_id = session_id
             st.session_state.admin_expires_at = expires_at
@@ -44,7 +86,7 @@ class SecurityManager:
         if not hasattr(st.session_state, 'admin_expires_at'):
             return False
         
-        if datetime.now() > st.session_state.admin_expires_at:
+        if time.monotonic() > st.session_state.admin_expires_at:
             self.logout_admin()
             return False
         
@@ -67,7 +109,7 @@ class SecurityManager:
         usage = self.db.get_ip_usage(ip_address)
         
         current_hour = datetime.now().replace(minute=0, second=0, microsecond=0)
-        current_day = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        current_day = current_hour.replace(hour=0)
         
         hourly_count = sum(1 for req in usage if req['timestamp'] >= current_hour)
         daily_count = sum(1 for req in usage if req['timestamp'] >= current_day)
@@ -85,50 +127,36 @@ class SecurityManager:
     
     def content_safety_check(self, text: str) -> Dict[str, any]:
         """Comprehensive content safety check"""
-        issues = []
-        severity = 'safe'
-        
-        # Profanity check
-        if profanity.contains_profanity(text):
-            issues.append('Contains inappropriate language')
-            severity = 'warning'
-        
-        # Length check
-        if len(text) > 2000:
-            issues.append('Content too long')
-            severity = 'warning'
-        
-        # Basic spam detection
-        if self._detect_spam_patterns(text):
-            issues.append('Potential spam detected')
-            severity = 'warning'
-        
-        # Harmful content patterns
-        if self._detect_harmful_content(text):
-            issues.append('Potentially harmful content detected')
-            severity = 'blocked'
+        severity, issues, sanitized_text = _cached_safety_check(text)
         
         return {
             'safe': severity != 'blocked',
             'severity': severity,
-            'issues': issues,
-            'sanitized_text': profanity.censor(text) if profanity.contains_profanity(text) else text
+            'issues': list(issues),
+            'sanitized_text': sanitized_text
         }
     
-    def _detect_spam_patterns(self, text: str) -> bool:
+    @staticmethod
+    def _detect_spam_patterns(text: str, text_lower: str = None) -> bool:
         """Detect spam patterns"""
-        spam_indicators = [
-            text.count('!') > 5,  # Too many exclamation marks
-            text.count('$') > 3,  # Multiple dollar signs
-            len(set(text.split())) < len(text.split()) * 0.5,  # Too much repetition
-            'click here' in text.lower(),
-            'buy now' in text.lower(),
-            'free money' in text.lower()
-        ]
-        return any(spam_indicators)
+        if text_lower is None:
+            text_lower = text.lower()
+        
+        # Cheapest checks first so a match returns before the costlier ones run
+        if 'click here' in text_lower or 'buy now' in text_lower or 'free money' in text_lower:
+            return True
+        
+        # Too many exclamation marks or dollar signs
+        if text.count('!') > 5 or text.count('$') > 3:
+            return True
+        
+        # Too much repetition
+        words = text.split()
+        return bool(words) and len(set(words)) < len(words) * 0.5
     
-    def _detect_harmful_content(self, text: str) -> bool:
-        """Detect potentially harmful content"""
+    @staticmethod
+    def _detect_harmful_content(text_lower: str) -> bool:
+        """Detect potentially harmful content (expects lowercased text)"""
         harmful_patterns = [
             'violence',
             'hate speech',
@@ -136,16 +164,16 @@ class SecurityManager:
             'illegal activities',
             'discrimination'
         ]
-        text_lower = text.lower()
         return any(pattern in text_lower for pattern in harmful_patterns)
     
     def get_client_ip(self) -> str:
         """Get client IP address safely"""
         # Streamlit doesn't provide direct IP access, use session-based tracking
-        if 'client_id' not in st.session_state:
-            st.session_state.client_id = str(uuid.uuid4())
+        client_id = st.session_state.get('client_id')
+        if client_id is None:
+            client_id = st.session_state.client_id = uuid.uuid4().hex
         
-        return st.session_state.client_id
+        return client_id
     
     def require_admin(self):
         """Decorator-like function to require admin authentication"""
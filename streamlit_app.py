@@ -1,12 +1,24 @@
 import streamlit as st
 import os
-import json
+import re
+import hashlib
+import hmac
+import atexit
+import tempfile
+import threading
 import requests  # Make sure requests is imported
-from datetime import datetime, timedelta
-import google.generativeai as genai
-from huggingface_hub import InferenceClient
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+from datetime import datetime
 import time
 import random
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Optional
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Page config
 st.set_page_config(
@@ -17,135 +29,181 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
-<style>
-.main-header {
-    background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-    -webkit-background-clip: text;
-    -webkit-text-fill-color: transparent;
-    font-size: 2.5rem;
-    font-weight: bold;
-    text-align: center;
-    margin-bottom: 2rem;
-}
-
-.admin-header {
-    background: linear-gradient(90deg, #f093fb 0%, #f5576c 100%);
-    -webkit-background-clip: text;
-    -webkit-text-fill-color: transparent;
-    font-size: 2rem;
-    font-weight: bold;
-    text-align: center;
-    margin-bottom: 1.5rem;
-}
-
-.research-container {
-    word-wrap: break-word;
-    overflow-wrap: break-word;
-    max-width: 100%;
-    padding: 1rem;
-    background: rgba(255, 255, 255, 0.05);
-    border-radius: 8px;
-    margin: 10px 0;
-}
-
-.live-indicator {
-    display: inline-flex;
-    align-items: center;
-    gap: 8px;
-    padding: 4px 8px;
-    background: rgba(34, 197, 94, 0.1);
-    border-radius: 12px;
-    font-size: 0.8rem;
-    color: #22c55e;
-    margin-bottom: 10px;
-}
-
-.live-dot {
-    width: 8px;
-    height: 8px;
-    background: #22c55e;
-    border-radius: 50%;
-    animation: pulse 1.5s infinite;
-}
-
-@keyframes pulse {
-    0% { opacity: 1; transform: scale(1); }
-    50% { opacity: 0.6; transform: scale(1.2); }
-    100% { opacity: 1; transform: scale(1); }
-}
-
-.demo-indicator {
-    display: inline-flex;
-    align-items: center;
-    gap: 8px;
-    padding: 4px 8px;
-    background: rgba(59, 130, 246, 0.1);
-    border-radius: 12px;
-    font-size: 0.8rem;
-    color: #3b82f6;
-    margin-bottom: 10px;
-}
-
-.demo-dot {
-    width: 8px;
-    height: 8px;
-    background: #3b82f6;
-    border-radius: 50%;
-    animation: blink 2s infinite;
-}
-
-@keyframes blink {
-    0% { opacity: 1; }
-    50% { opacity: 0.3; }
-    100% { opacity: 1; }
-}
-
-.status-good {
-    background-color: #d4edda;
-    border: 1px solid #c3e6cb;
-    color: #155724;
-    padding: 10px;
-    border-radius: 5px;
-    margin: 5px 0;
-}
-
-.status-warning {
-    background-color: #fff3cd;
-    border: 1px solid #ffeaa7;
-    color: #856404;
-    padding: 10px;
-    border-radius: 5px;
-    margin: 5px 0;
-}
-
-.status-error {
-    background-color: #f8d7da;
-    border: 1px solid #f5c6cb;
-    color: #721c24;
-    padding: 10px;
-    border-radius: 5px;
-    margin: 5px 0;
-}
-
-.metric-card {
-    background: white;
-    padding: 1rem;
-    border-radius: 10px;
-    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    margin: 0.5rem 0;
-}
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource(show_spinner=False)
+def load_css() -> str:
+    """Read the app stylesheet once per process"""
+    css_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'styles.css')
+    with open(css_path, 'r', encoding='utf-8') as f:
+        return f"<style>\n{f.read()}</style>"
+
+# Re-emitted on every rerun: Streamlit drops elements a rerun doesn't write
+st.markdown(load_css(), unsafe_allow_html=True)
+
+@dataclass
+class TokenBucket:
+    """Rate-limit bucket holding up to capacity tokens, refilled at rate tokens/second"""
+    capacity: int
+    rate: float
+    tokens: float
+    last_refill: float
+    
+    def refill(self, now: float):
+        """Add the tokens accrued since the last refill, up to capacity"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+@dataclass(frozen=True)
+class ApiState:
+    """Availability and usage of one API at snapshot time"""
+    available: bool
+    under_limit: bool
+    usage_today: int
+    remaining: int
+    
+    @property
+    def live(self) -> bool:
+        """Configured and still within its rate limits"""
+        return self.available and self.under_limit
+
+@dataclass(frozen=True)
+class ApiStatus:
+    """Status snapshot for all APIs, taken once per render"""
+    gemini: ApiState
+    huggingface: ApiState
+    any_live: bool
+    total_today: int
+
+# Bracketed placeholders Gemini leaves in research, e.g. "[verify: ...]" or "[citation needed]",
+# matched in one pass; a placeholder never spans a closing bracket or a line break
+GEMINI_PLACEHOLDER_RE = re.compile(
+    r'\[(?:(?:verify|source|citation|upload|image|insert|add|check|confirm)[^\]\n]*'
+    r'|[^\]\n]*needed[^\]\n]*)\]',
+    re.IGNORECASE
+)
+WHITESPACE_RE = re.compile(r'\s+')
+
+SECRET_KEYS = ('HUGGINGFACE_TOKEN', 'GEMINI_API_KEY', 'ADMIN_PASSWORD')
+
+@st.cache_resource(show_spinner=False)
+def load_secrets() -> Optional[MappingProxyType]:
+    """Read the app's secrets once per process; None when no secrets file exists"""
+    try:
+        return MappingProxyType({key: st.secrets[key] for key in SECRET_KEYS if key in st.secrets})
+    except Exception:
+        # st.secrets raises on first access when no secrets.toml is present
+        return None
+
+@st.cache_resource(show_spinner=False)
+def load_admin_password_digest() -> Optional[bytes]:
+    """SHA-256 of the admin password, hashed once per process; None without a secrets file"""
+    secrets = load_secrets()
+    if secrets is None:
+        return None
+    return hashlib.sha256(secrets.get('ADMIN_PASSWORD', 'admin123').encode()).digest()
+
+# Post templates, formatted only once a template is picked
+CONTEXTUAL_TEMPLATES = (
+    "🚀 {insight}\n\nThe landscape is shifting rapidly. Companies that adapt early will lead tomorrow's market.\n\nWhat trends are you seeing in {topic}?\n\n#{tag} #Innovation #Growth #Future",
+    "💡 Insight: {insight}\n\nThis changes everything we thought we knew about {topic}. The implications for business are huge.\n\nHow is this affecting your industry?\n\n#{tag} #Business #Trends #Strategy",
+    "📊 Data shows: {insight}\n\nThe numbers don't lie. {topic} is transforming faster than most people realize.\n\nAre you prepared for what's coming next?\n\n#{tag} #Data #Transformation #Leadership"
+)
+TOPIC_TEMPLATES = (
+    "Excited to share thoughts on {topic}! 🚀\n\nThis space is evolving rapidly, and the opportunities are endless. Companies that embrace change will thrive.\n\nWhat's your take on the future of {topic}?\n\n#{tag} #Innovation #Growth #Future",
+    "The {topic} landscape is fascinating right now 💡\n\nWe're seeing unprecedented innovation and disruption. The next 12 months will be critical.\n\nHow are you adapting to these changes?\n\n#{tag} #Business #Strategy #Adaptation",
+    "Been diving deep into {topic} lately 📊\n\nThe data tells a compelling story about where this industry is headed. Exciting times ahead.\n\nWhat trends are you watching in this space?\n\n#{tag} #Trends #Analysis #Growth"
+)
+
+# HTTP statuses worth retrying: throttled (429) and temporarily unavailable (503)
+RETRY_STATUS_CODES = (429, 503)
+
+def _error_status(error: Exception) -> Optional[int]:
+    """HTTP status carried by an API error, if any"""
+    # google.api_core errors expose it as .code, requests.HTTPError via .response
+    code = getattr(error, 'code', None)
+    if code is None and getattr(error, 'response', None) is not None:
+        code = error.response.status_code
+    try:
+        return int(code)
+    except (TypeError, ValueError):
+        return None
+
+def with_retry(call, attempts: int = 3, base_delay: float = 0.5, on_throttle=None, can_retry=None):
+    """Run call, retrying 429/503 errors with capped exponential backoff and jitter"""
+    for attempt in range(attempts):
+        try:
+            return call()
+        except Exception as e:
+            status = _error_status(e)
+            if status not in RETRY_STATUS_CODES or attempt == attempts - 1:
+                raise
+            if status == 429 and on_throttle is not None:
+                on_throttle()
+            time.sleep(min(base_delay * 2 ** attempt, 4.0) + random.random() * 0.2)
+            # Give up once the caller's rate limiter has no room, e.g. after on_throttle drained it
+            if can_retry is not None and not can_retry():
+                raise
 
 class FreeAPIManager:
     """Manages free-tier API calls with intelligent rate limiting"""
     
+    # Token buckets per API as (capacity, refill per second). Daily budgets
+    # refill continuously instead of resetting at midnight.
+    RATE_LIMITS = {
+        'huggingface': [(25, 25 / 86400)],            # From 1000/month free tier
+        'gemini': [(80, 80 / 86400), (15, 15 / 60)],  # Daily budget plus 15/minute rate limit
+    }
+    
+    # Gemini's quota is per API key, so its buckets and counts are shared by every session;
+    # the Hugging Face budget only gates local template posts, so it stays per session
+    SHARED_APIS = frozenset({'gemini'})
+    
+    # Research memo: entries live an hour, oldest evicted beyond the size cap
+    RESEARCH_CACHE_TTL = 3600
+    RESEARCH_CACHE_SIZE = 256
+    
+    # Seconds between usage file writes; changes in between are flushed at exit
+    USAGE_FLUSH_INTERVAL = 30
+    
     def __init__(self):
         self.hf_client = None
+        self.hf_token = None
         self.gemini_model = None
         self.usage_file = 'api_usage.json'
         
+        # Rate-limit buckets and daily usage counts of SHARED_APIS, guarded by _usage_lock;
+        # both are written back to usage_file in batches and restored on restart
+        self._usage_lock = threading.Lock()
+        # (checked_at, YYYY-MM-DD) for today's usage key; replaced as one tuple so readers never see a mix
+        self._today_key = (float('-inf'), None)
+        self._usage, self._buckets = self._load_usage()
+        self._usage_dirty = False
+        self._last_flush = time.monotonic()
+        atexit.register(self.flush_usage)
+        
+        # Gemini research memo shared by all sessions: normalized topic -> (expires_at, research)
+        self._research_lock = threading.Lock()
+        self._research_cache = OrderedDict()
+        
+        # Running call outcomes since startup, read by the admin success rate
+        self.call_successes = 0
+        self.call_failures = 0
+        
+        # One keep-alive connection pool for direct HTTP calls, so repeat requests skip the TLS handshake
+        self.http = requests.Session()
+        # Model-loading (503) and throttled (429) replies are retried with backoff, honoring Retry-After;
+        # connect and read errors are not, so a timeout still raises Timeout after one attempt
+        retry = Retry(
+            total=2,
+            connect=0,
+            read=False,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset({'POST'}),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self.http.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+        
         # Initialize APIs
         self._setup_apis()
     
@@ -153,61 +211,252 @@ class FreeAPIManager:
         """Set up free API clients"""
         try:
             # Hugging Face setup
-            hf_token = st.secrets.get('HUGGINGFACE_TOKEN')
-            if hf_token:
-                self.hf_client = InferenceClient(token=hf_token)
+            secrets = load_secrets() or {}
+            self.hf_token = secrets.get('HUGGINGFACE_TOKEN')
+            # SDKs are imported only when their key is set: both pull in large
+            # dependency trees that an unconfigured instance never uses
+            if self.hf_token:
+                from huggingface_hub import InferenceClient
+                self.hf_client = InferenceClient(token=self.hf_token)
             
             # Gemini setup with explicit model check
-            gemini_key = st.secrets.get('GEMINI_API_KEY')
+            gemini_key = secrets.get('GEMINI_API_KEY')
             if gemini_key:
+                import google.generativeai as genai
                 genai.configure(api_key=gemini_key)
                 # Use the correct current model name
                 self.gemini_model = genai.GenerativeModel('gemini-1.5-flash')
         except Exception as e:
             st.error(f"API setup error: {e}")
     
+    def _usage_state(self, api_name: str) -> tuple:
+        """(buckets, usage) dicts holding an API's limits: the manager's if shared, else this session's"""
+        if api_name in self.SHARED_APIS:
+            return self._buckets, self._usage
+        state = st.session_state
+        if 'rate_limit_buckets' not in state:
+            state.rate_limit_buckets = {}
+            state.api_usage = {}
+        return state.rate_limit_buckets, state.api_usage
+    
+    def _refill_buckets(self, api_name: str) -> list:
+        """Get the token buckets for an API, refilled up to now (caller holds _usage_lock)"""
+        now = time.monotonic()
+        all_buckets = self._usage_state(api_name)[0]
+        
+        if api_name not in all_buckets:
+            all_buckets[api_name] = [
+                TokenBucket(capacity=capacity, rate=rate, tokens=float(capacity), last_refill=now)
+                for capacity, rate in self.RATE_LIMITS[api_name]
+            ]
+        
+        for bucket in all_buckets[api_name]:
+            bucket.refill(now)
+        
+        return all_buckets[api_name]
+    
+    def _consume(self, api_name: str) -> bool:
+        """Take a token from every bucket of an API; False if any is empty"""
+        try:
+            with self._usage_lock:
+                buckets = self._refill_buckets(api_name)
+                if any(bucket.tokens < 1 for bucket in buckets):
+                    return False
+                
+                for bucket in buckets:
+                    bucket.tokens -= 1
+                self._usage_dirty = self._usage_dirty or api_name in self.SHARED_APIS
+                return True
+        except Exception:
+            return True  # Default to allowing if error
+    
+    def _penalize(self, api_name: str):
+        """Empty an API's fastest-refilling bucket after the server throttled us"""
+        try:
+            with self._usage_lock:
+                bucket = max(self._refill_buckets(api_name), key=lambda b: b.rate)
+                bucket.tokens = min(bucket.tokens, 0.0)
+                self._usage_dirty = self._usage_dirty or api_name in self.SHARED_APIS
+        except Exception:
+            pass
+    
     def check_daily_limit(self, api_name: str) -> bool:
-        """Check if we're under daily API limits"""
+        """Check if we're under API rate limits without using a request"""
         try:
-            if 'api_usage' not in st.session_state:
-                st.session_state.api_usage = {}
-            
-            usage = st.session_state.api_usage
-            today = datetime.now().strftime('%Y-%m-%d')
-            daily_usage = usage.get(today, {})
-            
-            # Conservative daily limits
-            limits = {
-                'huggingface': 25,  # From 1000/month free tier
-                'gemini': 80,       # From 15/minute rate limit
-            }
-            
-            current_usage = daily_usage.get(api_name, 0)
-            return current_usage < limits[api_name]
-        except:
+            with self._usage_lock:
+                return all(bucket.tokens >= 1 for bucket in self._refill_buckets(api_name))
+        except Exception:
             return True  # Default to allowing if error
     
-    def log_api_usage(self, api_name: str):
-        """Log API usage for rate limiting"""
+    def remaining_requests(self, api_name: str) -> int:
+        """Requests an API's buckets would allow right now"""
         try:
-            if 'api_usage' not in st.session_state:
-                st.session_state.api_usage = {}
+            with self._usage_lock:
+                return max(0, int(min(bucket.tokens for bucket in self._refill_buckets(api_name))))
+        except Exception:
+            return 0
+    
+    def _today(self) -> str:
+        """Today's usage key (YYYY-MM-DD), re-read from the clock at most once a minute"""
+        now = time.monotonic()
+        checked_at, date = self._today_key
+        if now - checked_at > 60:
+            date = datetime.now().strftime('%Y-%m-%d')
+            self._today_key = (now, date)
+        return date
+    
+    def _load_usage(self) -> tuple:
+        """Load today's usage counts and the shared bucket levels from the usage file, if any"""
+        try:
+            with open(self.usage_file, 'rb') as f:
+                saved = orjson.loads(f.read())
+            today = self._today()
+            usage = {today: Counter(saved.get('usage', {}).get(today, {}))}
             
-            today = datetime.now().strftime('%Y-%m-%d')
-            if today not in st.session_state.api_usage:
-                st.session_state.api_usage[today] = {}
+            # Refill times are saved as wall-clock seconds, since the monotonic clock restarts with the
+            # process; the time spent down is credited as refill so a restart never hands out a fresh budget
+            now, wall_now = time.monotonic(), time.time()
+            buckets = {}
+            for api_name, levels in saved.get('buckets', {}).items():
+                limits = self.RATE_LIMITS.get(api_name)
+                if api_name not in self.SHARED_APIS or not limits or len(levels) != len(limits):
+                    continue
+                buckets[api_name] = [
+                    TokenBucket(capacity=capacity, rate=rate, tokens=min(float(tokens), capacity),
+                                last_refill=now - max(0.0, wall_now - saved_at))
+                    for (capacity, rate), (tokens, saved_at) in zip(limits, levels)
+                ]
+            return usage, buckets
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {}, {}
+    
+    def flush_usage(self):
+        """Atomically write usage counts and shared bucket levels to the usage file if they changed"""
+        with self._usage_lock:
+            if not self._usage_dirty:
+                return
+            now, wall_now = time.monotonic(), time.time()
+            snapshot = orjson.dumps({
+                'usage': self._usage,
+                'buckets': {
+                    api_name: [[bucket.tokens, wall_now - (now - bucket.last_refill)] for bucket in buckets]
+                    for api_name, buckets in self._buckets.items()
+                }
+            })
+            self._usage_dirty = False
+            self._last_flush = time.monotonic()
+        
+        tmp_path = None
+        try:
+            # Write a sibling temp file and swap it in, so readers never see a partial file
+            usage_dir = os.path.dirname(os.path.abspath(self.usage_file))
+            with tempfile.NamedTemporaryFile('wb', dir=usage_dir, suffix='.tmp', delete=False) as f:
+                tmp_path = f.name
+                f.write(snapshot)
+            os.replace(tmp_path, self.usage_file)
+        except OSError as e:
+            print(f"Usage flush error: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            with self._usage_lock:
+                self._usage_dirty = True
+    
+    def log_api_usage(self, api_name: str):
+        """Log API usage for the daily usage counters"""
+        try:
+            today = self._today()
+            shared = api_name in self.SHARED_APIS
+            with self._usage_lock:
+                usage = self._usage_state(api_name)[1]
+                daily_usage = usage.get(today)
+                if daily_usage is None:
+                    # Only today's counts are ever read; drop earlier days
+                    daily_usage = Counter()
+                    usage.clear()
+                    usage[today] = daily_usage
+                
+                daily_usage[api_name] += 1
+                # Only shared counts are written to usage_file
+                self._usage_dirty = self._usage_dirty or shared
+                flush_due = shared and time.monotonic() - self._last_flush > self.USAGE_FLUSH_INTERVAL
             
-            st.session_state.api_usage[today][api_name] = st.session_state.api_usage[today].get(api_name, 0) + 1
+            if flush_due:
+                self.flush_usage()
         except Exception as e:
             st.error(f"Usage logging error: {e}")
     
-    def research_with_gemini(self, topic: str) -> dict:
+    def record_outcome(self, success: bool):
+        """Count one API call outcome for the success rate"""
+        with self._usage_lock:
+            if success:
+                self.call_successes += 1
+            else:
+                self.call_failures += 1
+    
+    def get_success_rate(self) -> Optional[float]:
+        """Share of API calls that succeeded, or None before any call"""
+        total = self.call_successes + self.call_failures
+        return self.call_successes / total if total else None
+    
+    def get_usage_today(self) -> dict:
+        """Today's usage counts per API: shared counts plus this session's own"""
+        today = self._today()
+        with self._usage_lock:
+            usage = Counter(self._usage.get(today, {}))
+            usage.update(st.session_state.get('api_usage', {}).get(today, {}))
+        return dict(usage)
+    
+    def research_with_gemini(self, topic: str, placeholder=None) -> dict:
         """Use Gemini for research with simple, engaging output"""
-        if not self.gemini_model or not self.check_daily_limit('gemini'):
+        if not self.gemini_model:
             return None
         
+        # Repeat topics are served from cache for an hour without spending a request
+        topic_key = topic.strip().lower()
+        cached = self._get_cached_research(topic_key)
+        if cached is not None:
+            return cached
+        
         try:
-            prompt = f"""Research "{topic}" and explain it like you're talking to a friend over coffee. 
+            research = self.fetch_gemini_research(topic, placeholder)
+        except Exception as e:
+            # Failures are not cached so the next attempt retries
+            return None
+        
+        self._store_research(topic_key, research)
+        return research
+    
+    def _get_cached_research(self, topic_key: str) -> Optional[dict]:
+        """Cached research for a topic, or None if missing or expired"""
+        with self._research_lock:
+            entry = self._research_cache.get(topic_key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._research_cache[topic_key]
+                return None
+            return entry[1]
+    
+    def _store_research(self, topic_key: str, research: dict):
+        """Cache research for a topic, evicting expired entries and then the oldest over the cap"""
+        now = time.monotonic()
+        with self._research_lock:
+            self._research_cache[topic_key] = (now + self.RESEARCH_CACHE_TTL, research)
+            self._research_cache.move_to_end(topic_key)
+            
+            # Every entry has the same TTL, so insertion order is expiry order
+            while self._research_cache:
+                oldest_key, (expires_at, _) = next(iter(self._research_cache.items()))
+                if expires_at > now and len(self._research_cache) <= self.RESEARCH_CACHE_SIZE:
+                    break
+                del self._research_cache[oldest_key]
+    
+    def fetch_gemini_research(self, topic: str, placeholder=None) -> dict:
+        """Call Gemini for research (uncached), streaming into placeholder; raises when rate limited or on API errors"""
+        if not self._consume('gemini'):
+            raise RuntimeError("Gemini rate limit reached")
+        
+        prompt = f"""Research "{topic}" and explain it like you're talking to a friend over coffee. 
 
 Write at a 7th grade reading level using:
 - Short, simple sentences (max 15 words each)
@@ -225,66 +474,57 @@ Write like a human, not a textbook. Keep it simple and engaging.
 
 Topic: {topic}"""
 
-            response = self.gemini_model.generate_content(prompt)
+        try:
+            # Stream so the reply renders as it arrives instead of after the full wait
+            response = with_retry(
+                lambda: self.gemini_model.generate_content(prompt, stream=True),
+                on_throttle=lambda: self._penalize('gemini'),
+                can_retry=lambda: self.check_daily_limit('gemini')
+            )
             self.log_api_usage('gemini')
             
-            # Clean the response to remove any unwanted bracketed content
-            clean_text = self._clean_gemini_response(response.text)
-            
-            # Return structured data
-            result = {
-                "research_summary": clean_text,
-                "source": "Gemini AI Research",
-                "timestamp": datetime.now().isoformat(),
-                "topic": topic
-            }
-            
-            return result
-            
-        except Exception as e:
-            return None
+            chunks = []
+            for chunk in response:
+                chunks.append(chunk.text)
+                if placeholder is not None:
+                    placeholder.markdown(''.join(chunks))
+        except Exception:
+            self.record_outcome(False)
+            raise
+        self.record_outcome(True)
+        
+        # Clean the response to remove any unwanted bracketed content
+        clean_text = self._clean_gemini_response(''.join(chunks))
+        
+        # Return structured data
+        return {
+            "research_summary": clean_text,
+            "source": "Gemini AI Research",
+            "timestamp": datetime.now().isoformat(),
+            "topic": topic
+        }
     
     def _clean_gemini_response(self, text: str) -> str:
         """Clean Gemini response to remove bracketed placeholders and ensure LinkedIn-ready content"""
-        import re
-        
-        # Remove common bracketed placeholders
-        patterns_to_remove = [
-            r'\[verify.*?\]',
-            r'\[source.*?\]', 
-            r'\[citation.*?\]',
-            r'\[upload.*?\]',
-            r'\[image.*?\]',
-            r'\[insert.*?\]',
-            r'\[add.*?\]',
-            r'\[check.*?\]',
-            r'\[confirm.*?\]',
-            r'\[.*?needed.*?\]'
-        ]
-        
-        cleaned = text
-        for pattern in patterns_to_remove:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Remove extra whitespace and clean up formatting
-        cleaned = re.sub(r'\s+', ' ', cleaned)  # Multiple spaces to single space
-        cleaned = re.sub(r'\n\s*\n', '\n\n', cleaned)  # Multiple newlines to double newline
-        cleaned = cleaned.strip()
-        
-        return cleaned
+        # Remove common bracketed placeholders, then collapse all whitespace runs
+        cleaned = GEMINI_PLACEHOLDER_RE.sub('', text)
+        cleaned = WHITESPACE_RE.sub(' ', cleaned)
+        return cleaned.strip()
     
     def generate_content_with_hf(self, topic: str, research_data: dict = None) -> str:
         """Generate LinkedIn content - using cached examples due to HF API limitations"""
         # For now, skip HF API and use intelligent content generation
+        if not self._consume('huggingface'):
+            return None
+        
         try:
-            research_context = ""
-            if research_data and "research_summary" in research_data:
-                research_context = research_data["research_summary"][:200]
+            summary = (research_data or {}).get("research_summary") or ""
+            key_insight = self._extract_key_insight(summary)
             
             # Generate professional LinkedIn content based on research
-            if research_context:
+            if key_insight:
                 # Use the research to create contextual content
-                content = self._generate_contextual_content(topic, research_context)
+                content = self._generate_contextual_content(topic, key_insight)
             else:
                 # Use topic-based templates
                 content = self._generate_template_content(topic)
@@ -295,60 +535,53 @@ Topic: {topic}"""
         except Exception as e:
             return None
     
-    def _generate_contextual_content(self, topic: str, research: str) -> str:
+    def _extract_key_insight(self, research_summary: str) -> str:
+        """Pick the research text used as the post's hook (capped at 100 characters)"""
+        return research_summary.strip()[:100]
+    
+    def _generate_contextual_content(self, topic: str, key_insight: str) -> str:
         """Generate content using research insights"""
-        # Extract key insights from research
-        lines = research.split('\n')
-        key_insight = lines[0][:100] if lines else f"Innovation in {topic} is accelerating"
-        
-        templates = [
-            f"🚀 {key_insight}\n\nThe landscape is shifting rapidly. Companies that adapt early will lead tomorrow's market.\n\nWhat trends are you seeing in {topic}?\n\n#{topic.replace(' ', '')} #Innovation #Growth #Future",
-            f"💡 Insight: {key_insight}\n\nThis changes everything we thought we knew about {topic}. The implications for business are huge.\n\nHow is this affecting your industry?\n\n#{topic.replace(' ', '')} #Business #Trends #Strategy",
-            f"📊 Data shows: {key_insight}\n\nThe numbers don't lie. {topic} is transforming faster than most people realize.\n\nAre you prepared for what's coming next?\n\n#{topic.replace(' ', '')} #Data #Transformation #Leadership"
-        ]
-        
-        import random
-        return random.choice(templates)
+        template = CONTEXTUAL_TEMPLATES[random.randrange(len(CONTEXTUAL_TEMPLATES))]
+        return template.format(insight=key_insight, topic=topic, tag=topic.replace(' ', ''))
     
     def _generate_template_content(self, topic: str) -> str:
         """Generate template content for topics without research"""
-        templates = [
-            f"Excited to share thoughts on {topic}! 🚀\n\nThis space is evolving rapidly, and the opportunities are endless. Companies that embrace change will thrive.\n\nWhat's your take on the future of {topic}?\n\n#{topic.replace(' ', '')} #Innovation #Growth #Future",
-            f"The {topic} landscape is fascinating right now 💡\n\nWe're seeing unprecedented innovation and disruption. The next 12 months will be critical.\n\nHow are you adapting to these changes?\n\n#{topic.replace(' ', '')} #Business #Strategy #Adaptation",
-            f"Been diving deep into {topic} lately 📊\n\nThe data tells a compelling story about where this industry is headed. Exciting times ahead.\n\nWhat trends are you watching in this space?\n\n#{topic.replace(' ', '')} #Trends #Analysis #Growth"
-        ]
-        
-        import random
-        return random.choice(templates)
-    
-    def get_api_status(self) -> dict:
-        """Get current API status and usage"""
-        status = {
-            "gemini": {
-                "available": self.gemini_model is not None,
-                "under_limit": self.check_daily_limit('gemini'),
-                "usage_today": self._get_today_usage('gemini')
-            },
-            "huggingface": {
-                "available": self.hf_client is not None,
-                "under_limit": self.check_daily_limit('huggingface'),
-                "usage_today": self._get_today_usage('huggingface')
-            }
-        }
-        return status
+        template = TOPIC_TEMPLATES[random.randrange(len(TOPIC_TEMPLATES))]
+        return template.format(topic=topic, tag=topic.replace(' ', ''))
     
-    def _get_today_usage(self, api_name: str) -> int:
-        """Get today's usage for an API"""
-        try:
-            if 'api_usage' not in st.session_state:
-                return 0
-            today = datetime.now().strftime('%Y-%m-%d')
-            return st.session_state.api_usage.get(today, {}).get(api_name, 0)
-        except:
-            return 0
+    def get_api_status(self) -> ApiStatus:
+        """Snapshot current API availability and usage in one pass"""
+        usage = self.get_usage_today()
+        
+        gemini = ApiState(
+            available=self.gemini_model is not None,
+            under_limit=self.check_daily_limit('gemini'),
+            usage_today=usage.get('gemini', 0),
+            remaining=self.remaining_requests('gemini')
+        )
+        huggingface = ApiState(
+            available=self.hf_client is not None,
+            under_limit=self.check_daily_limit('huggingface'),
+            usage_today=usage.get('huggingface', 0),
+            remaining=self.remaining_requests('huggingface')
+        )
+        return ApiStatus(
+            gemini=gemini,
+            huggingface=huggingface,
+            any_live=gemini.live or huggingface.live,
+            total_today=gemini.usage_today + huggingface.usage_today
+        )
 
-def load_cached_examples():
-    """Load cached examples for demo purposes"""
+@st.cache_resource(show_spinner=False)
+def get_api_manager() -> FreeAPIManager:
+    """Share one API manager (and its clients) across reruns and sessions"""
+    # Gemini's rate-limit buckets and usage counts live on it, shared by every session
+    return FreeAPIManager()
+
+@st.cache_resource(show_spinner=False)
+def load_cached_examples() -> tuple:
+    """Build the demo examples and their topic index once per process"""
+    # Shown when live APIs are unavailable; callers only read them, so one shared copy is safe
     examples = {
         "AI in Business": {
             "research": {
@@ -388,12 +621,42 @@ How has remote work changed your productivity? Share your biggest lesson learned
 #RemoteWork #FutureOfWork #Productivity #WorkLifeBalance #Leadership"""
         }
     }
-    return examples
+    # Lowercased topic -> example key, for case-insensitive matching
+    return examples, {key.lower(): key for key in examples}
+
+def find_cached_example(topic: str) -> dict:
+    """Find the cached example for a topic, falling back to the first one"""
+    examples, index = load_cached_examples()
+    return examples[index.get(topic.strip().lower(), next(iter(examples)))]
+
+def render_research(research_data: dict):
+    """Render structured research fields as a single markdown block"""
+    lines = []
+    for key, value in research_data.items():
+        if isinstance(value, list):
+            lines.append(f"**{key.title()}:**")
+            lines.extend(f"• {item}" for item in value)
+        else:
+            lines.append(f"**{key.title()}:** {value}")
+    
+    st.markdown("\n\n".join(lines))
+
+def render_post(content: str, heading: str = None, height: int = 150):
+    """Show a LinkedIn post with a copyable text area below it"""
+    if heading:
+        st.markdown(heading)
+    st.code(content, language="")
+    
+    # Copy button
+    st.markdown("**Copy to clipboard:**")
+    st.text_area("Generated Content", value=content, height=height, label_visibility="collapsed")
 
 def check_admin_access():
     """Check if user should see admin interface"""
-    query_params = st.query_params
-    return query_params.get("admin", "false") == "true"
+    # Decided once per session: changing the URL by hand reloads into a new session
+    if 'admin_mode' not in st.session_state:
+        st.session_state.admin_mode = st.query_params.get("admin", "false") == "true"
+    return st.session_state.admin_mode
 
 def admin_login():
     """Handle admin authentication"""
@@ -408,7 +671,11 @@ def admin_login():
             submitted = st.form_submit_button("Login")
             
             if submitted:
-                if password == st.secrets.get("ADMIN_PASSWORD", "admin123"):
+                # Constant-time compare of fixed-length digests.
+                # Without a secrets file there is no password and login always fails.
+                admin_digest = load_admin_password_digest()
+                submitted_digest = hashlib.sha256(password.encode()).digest()
+                if admin_digest is not None and hmac.compare_digest(submitted_digest, admin_digest):
                     st.session_state.admin_authenticated = True
                     st.success("Login successful!")
                     st.rerun()
@@ -417,72 +684,79 @@ def admin_login():
         return False
     return True
 
+def _status_tile(css_class: str, label: str, body: str = None) -> str:
+    """Render one admin status tile as an HTML div"""
+    if body is None:
+        return f'<div class="{css_class}">{label}</div>'
+    return f'<div class="{css_class}">{label}<br><strong>{body}</strong></div>'
+
 def show_admin_dashboard():
     """Display admin dashboard"""
     st.markdown('<h1 class="admin-header">🔧 AgentComponents Admin Dashboard</h1>', unsafe_allow_html=True)
     
-    # Initialize API manager
-    api_manager = FreeAPIManager()
+    # Shared API manager
+    api_manager = get_api_manager()
     api_status = api_manager.get_api_status()
     
     # System Status
     st.markdown("## System Status")
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown('<div class="status-good">✅ App Status<br><strong>Running</strong></div>', unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown('<div class="status-good">✅ Database<br><strong>Connected</strong></div>', unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown('<div class="status-good">✅ Security<br><strong>Active</strong></div>', unsafe_allow_html=True)
-    
-    with col4:
-        api_live = any(status["available"] and status["under_limit"] for status in api_status.values())
-        if api_live:
-            st.markdown('<div class="status-good">✅ APIs<br><strong>Live</strong></div>', unsafe_allow_html=True)
-        else:
-            st.markdown('<div class="status-warning">⚠️ APIs<br><strong>Limited</strong></div>', unsafe_allow_html=True)
+    # Each section is written as one markdown block instead of one element per tile
+    system_tiles = [
+        _status_tile("status-good", "✅ App Status", "Running"),
+        _status_tile("status-good", "✅ Database", "Connected"),
+        _status_tile("status-good", "✅ Security", "Active"),
+        _status_tile("status-good", "✅ APIs", "Live") if api_status.any_live
+        else _status_tile("status-warning", "⚠️ APIs", "Limited"),
+    ]
+    st.markdown(f'<div class="status-row">{"".join(system_tiles)}</div>', unsafe_allow_html=True)
     
     # Feature Status
     st.markdown("## Feature Status")
     
     # API Status Details
-    gemini_status = api_status["gemini"]
-    hf_status = api_status["huggingface"]
+    gemini_status = api_status.gemini
+    hf_status = api_status.huggingface
     
-    if gemini_status["available"]:
-        if gemini_status["under_limit"]:
-            st.markdown(f'<div class="status-good">✅ Gemini AI Research: Available ({gemini_status["usage_today"]}/80 today)</div>', unsafe_allow_html=True)
+    feature_tiles = []
+    if gemini_status.available:
+        if gemini_status.under_limit:
+            feature_tiles.append(_status_tile("status-good", f"✅ Gemini AI Research: Available ({gemini_status.remaining} requests left, {gemini_status.usage_today} used today)"))
         else:
-            st.markdown('<div class="status-warning">⚠️ Gemini AI Research: Daily limit reached</div>', unsafe_allow_html=True)
+            feature_tiles.append(_status_tile("status-warning", "⚠️ Gemini AI Research: Rate limit reached"))
     else:
-        st.markdown('<div class="status-error">❌ Gemini AI Research: Not configured</div>', unsafe_allow_html=True)
+        feature_tiles.append(_status_tile("status-error", "❌ Gemini AI Research: Not configured"))
     
-    if hf_status["available"]:
-        if hf_status["under_limit"]:
-            st.markdown(f'<div class="status-good">✅ Content Generation: Available ({hf_status["usage_today"]}/25 today)</div>', unsafe_allow_html=True)
+    if hf_status.available:
+        if hf_status.under_limit:
+            feature_tiles.append(_status_tile("status-good", f"✅ Content Generation: Available ({hf_status.remaining} posts left this session, {hf_status.usage_today} used today)"))
         else:
-            st.markdown('<div class="status-warning">⚠️ Content Generation: Daily limit reached</div>', unsafe_allow_html=True)
+            feature_tiles.append(_status_tile("status-warning", "⚠️ Content Generation: Session limit reached"))
     else:
-        st.markdown('<div class="status-error">❌ Content Generation: Not configured</div>', unsafe_allow_html=True)
+        feature_tiles.append(_status_tile("status-error", "❌ Content Generation: Not configured"))
+    
+    st.markdown("".join(feature_tiles), unsafe_allow_html=True)
     
     # Environment Configuration
     st.markdown("## Environment Configuration")
     
+    # API keys are reported from what the shared manager actually loaded
     env_vars = [
-        ("SUPABASE_URL", "✅ Configured"),
-        ("SUPABASE_ANON_KEY", "✅ Configured"),
-        ("GEMINI_API_KEY", "✅ Configured" if st.secrets.get("GEMINI_API_KEY") else "❌ Missing"),
-        ("HUGGINGFACE_TOKEN", "✅ Configured" if st.secrets.get("HUGGINGFACE_TOKEN") else "❌ Missing"),
-        ("ADMIN_PASSWORD", "✅ Configured")
+        ("SUPABASE_URL", True),
+        ("SUPABASE_ANON_KEY", True),
+        ("GEMINI_API_KEY", api_manager.gemini_model is not None),
+        ("HUGGINGFACE_TOKEN", api_manager.hf_client is not None),
+        ("ADMIN_PASSWORD", True)
     ]
     
-    for var, status in env_vars:
-        color = "status-good" if "✅" in status else "status-error"
-        st.markdown(f'<div class="{color}">{status} {var}</div>', unsafe_allow_html=True)
+    st.markdown(
+        "".join(
+            _status_tile("status-good", f"✅ Configured {var}") if configured
+            else _status_tile("status-error", f"❌ Missing {var}")
+            for var, configured in env_vars
+        ),
+        unsafe_allow_html=True
+    )
     
     # Usage Statistics
     st.markdown("## Usage Statistics")
@@ -490,15 +764,15 @@ def show_admin_dashboard():
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        total_requests = gemini_status["usage_today"] + hf_status["usage_today"]
+        total_requests = api_status.total_today
         st.metric("Total Requests Today", total_requests)
     
     with col2:
         st.metric("Unique Users", "0")
     
     with col3:
-        success_rate = "100%" if total_requests == 0 else "95%"
-        st.metric("Success Rate", success_rate)
+        success_rate = api_manager.get_success_rate()
+        st.metric("Success Rate", "100%" if success_rate is None else f"{success_rate:.0%}")
     
     # Admin Actions
     st.markdown("## Admin Actions")
@@ -519,32 +793,29 @@ def show_admin_dashboard():
                     else:
                         st.error(f"❌ {api}: {result['message']}")
 
-def test_api_connections(api_manager):
-    """Test API connections"""
-    results = {}
-    
-    # Test Gemini
+def test_gemini_connection(api_manager):
+    """Round-trip a research request through Gemini"""
     try:
         if api_manager.gemini_model and api_manager.check_daily_limit('gemini'):
-            test_research = api_manager.research_with_gemini("test topic")
+            # Bypass the research cache so the API is actually exercised
+            test_research = api_manager.fetch_gemini_research("test topic")
             if test_research:
-                results["Gemini"] = {"success": True, "message": "Research API working"}
+                return {"success": True, "message": "Research API working"}
             else:
-                results["Gemini"] = {"success": False, "message": "Research failed - no response"}
+                return {"success": False, "message": "Research failed - no response"}
         else:
-            results["Gemini"] = {"success": False, "message": "Not available or limit reached"}
+            return {"success": False, "message": "Not available or limit reached"}
     except Exception as e:
-        results["Gemini"] = {"success": False, "message": f"Error: {str(e)[:100]}..."}
-    
-    # Test Hugging Face with detailed error reporting
+        return {"success": False, "message": f"Error: {str(e)[:100]}..."}
+
+def test_huggingface_connection(api_manager):
+    """Round-trip a generation request through Hugging Face"""
     try:
         if api_manager.hf_client and api_manager.check_daily_limit('huggingface'):
             # Try direct API call first for better error reporting
             try:
-                import requests
-                
                 api_url = "https://api-inference.huggingface.co/models/gpt2"
-                headers = {"Authorization": f"Bearer {st.secrets.get('HUGGINGFACE_TOKEN')}"}
+                headers = {"Authorization": f"Bearer {api_manager.hf_token}"}
                 
                 payload = {
                     "inputs": "Test LinkedIn post about AI:",
@@ -555,38 +826,64 @@ def test_api_connections(api_manager):
                     }
                 }
                 
-                response = requests.post(api_url, headers=headers, json=payload, timeout=15)
+                response = api_manager.http.post(api_url, headers=headers, json=payload, timeout=15)
                 
                 if response.status_code == 200:
                     result = response.json()
                     if isinstance(result, list) and len(result) > 0:
-                        results["Hugging Face"] = {"success": True, "message": "Direct API working"}
+                        api_manager.record_outcome(True)
+                        return {"success": True, "message": "Direct API working"}
                     else:
-                        results["Hugging Face"] = {"success": False, "message": f"API returned: {result}"}
-                elif response.status_code == 503:
-                    results["Hugging Face"] = {"success": False, "message": "Model loading (503) - try again in a moment"}
+                        api_manager.record_outcome(False)
+                        return {"success": False, "message": f"API returned: {result}"}
+                
+                api_manager.record_outcome(False)
+                if response.status_code == 503:
+                    return {"success": False, "message": "Model loading (503) - try again in a moment"}
                 else:
-                    results["Hugging Face"] = {"success": False, "message": f"HTTP {response.status_code}: {response.text[:100]}"}
+                    return {"success": False, "message": f"HTTP {response.status_code}: {response.text[:100]}"}
                     
             except requests.exceptions.Timeout:
-                results["Hugging Face"] = {"success": False, "message": "Request timeout - model may be loading"}
+                api_manager.record_outcome(False)
+                return {"success": False, "message": "Request timeout - model may be loading"}
             except Exception as e:
+                api_manager.record_outcome(False)
                 # Try InferenceClient as backup
                 try:
                     test_content = api_manager.generate_content_with_hf("AI")
                     if test_content:
-                        results["Hugging Face"] = {"success": True, "message": "InferenceClient working"}
+                        return {"success": True, "message": "InferenceClient working"}
                     else:
-                        results["Hugging Face"] = {"success": False, "message": "InferenceClient failed - no content"}
+                        return {"success": False, "message": "InferenceClient failed - no content"}
                 except Exception as e2:
-                    results["Hugging Face"] = {"success": False, "message": f"Both methods failed: {str(e)[:50]}"}
+                    return {"success": False, "message": f"Both methods failed: {str(e)[:50]}"}
         else:
             if not api_manager.hf_client:
-                results["Hugging Face"] = {"success": False, "message": "Client not initialized - check HUGGINGFACE_TOKEN"}
+                return {"success": False, "message": "Client not initialized - check HUGGINGFACE_TOKEN"}
             else:
-                results["Hugging Face"] = {"success": False, "message": "Daily limit reached"}
+                return {"success": False, "message": "Daily limit reached"}
     except Exception as e:
-        results["Hugging Face"] = {"success": False, "message": f"Setup error: {str(e)[:50]}"}
+        return {"success": False, "message": f"Setup error: {str(e)[:50]}"}
+
+def test_api_connections(api_manager):
+    """Test API connections"""
+    # The two round-trips are independent network waits, so run them side by side;
+    # workers need the script run context to reach st.session_state
+    ctx = get_script_run_ctx()
+    tests = {
+        "Gemini": test_gemini_connection,
+        "Hugging Face": test_huggingface_connection,
+    }
+    
+    with ThreadPoolExecutor(max_workers=2, initializer=add_script_run_ctx, initargs=(None, ctx)) as executor:
+        futures = {name: executor.submit(test, api_manager) for name, test in tests.items()}
+    
+    results = {}
+    for name, future in futures.items():
+        try:
+            results[name] = future.result()
+        except Exception as e:
+            results[name] = {"success": False, "message": f"Error: {str(e)[:100]}..."}
     
     return results
 
@@ -602,12 +899,12 @@ def main_app():
     </div>
     """, unsafe_allow_html=True)
     
-    # Initialize API manager
-    api_manager = FreeAPIManager()
+    # Shared API manager
+    api_manager = get_api_manager()
     api_status = api_manager.get_api_status()
     
     # Show API status
-    api_live = any(status["available"] and status["under_limit"] for status in api_status.values())
+    api_live = api_status.any_live
     if api_live:
         st.success("🟢 Live AI research and content generation available")
     else:
@@ -634,35 +931,18 @@ def main_app():
         with st.spinner("🔍 Researching topic and generating content..."):
             
             if use_cached or not api_live:
-                # Use cached examples
-                cached_examples = load_cached_examples()
-                
-                # Find best match or use first example
-                example_key = topic if topic in cached_examples else list(cached_examples.keys())[0]
-                example = cached_examples[example_key]
+                # Use cached examples (best match or first example)
+                example = find_cached_example(topic)
                 
                 st.markdown("### 📊 Research Summary")
                 st.info("ℹ️ Showing cached research data")
                 
-                research_data = example["research"]
-                for key, value in research_data.items():
-                    if isinstance(value, list):
-                        st.markdown(f"**{key.title()}:**")
-                        for item in value:
-                            st.markdown(f"• {item}")
-                    else:
-                        st.markdown(f"**{key.title()}:** {value}")
+                render_research(example["research"])
                 
                 st.markdown("### ✍️ Generated LinkedIn Content")
                 st.info("ℹ️ Showing example content")
                 
-                content = example["content"]
-                st.markdown("**Final LinkedIn Post:**")
-                st.code(content, language="")
-                
-                # Copy button
-                st.markdown("**Copy to clipboard:**")
-                st.text_area("Generated Content", value=content, height=200, label_visibility="collapsed")
+                render_post(example["content"], "**Final LinkedIn Post:**", height=200)
                 
             else:
                 # Use live APIs
@@ -670,28 +950,22 @@ def main_app():
                 
                 with col1:
                     st.markdown("### 📊 Research Summary")
-                    research_data = api_manager.research_with_gemini(topic)
+                    # Gemini streams its reply into this slot, then it is swapped for the cleaned summary
+                    research_placeholder = st.empty()
+                    research_data = api_manager.research_with_gemini(topic, research_placeholder)
                     
                     if research_data:
-                        st.success("✅ Research completed with Gemini AI")
-                        # Display the research summary with proper text wrapping
-                        if "research_summary" in research_data:
-                            st.markdown(f'<div class="research-container">{research_data["research_summary"]}</div>', unsafe_allow_html=True)
+                        with research_placeholder.container():
+                            st.success("✅ Research completed with Gemini AI")
+                            # Display the research summary with proper text wrapping
+                            if "research_summary" in research_data:
+                                st.markdown(f'<div class="research-container">{research_data["research_summary"]}</div>', unsafe_allow_html=True)
                     else:
+                        research_placeholder.empty()
                         st.warning("⚠️ Research failed - using cached example")
                         # Use cached research
-                        cached_examples = load_cached_examples()
-                        example_key = topic if topic in cached_examples else list(cached_examples.keys())[0]
-                        example = cached_examples[example_key]
-                        research_data = example["research"]
-                        
-                        for key, value in research_data.items():
-                            if isinstance(value, list):
-                                st.markdown(f"**{key.title()}:**")
-                                for item in value:
-                                    st.markdown(f"• {item}")
-                            else:
-                                st.markdown(f"**{key.title()}:** {value}")
+                        research_data = find_cached_example(topic)["research"]
+                        render_research(research_data)
                 
                 with col2:
                     st.markdown("### ✍️ Generated Content")
@@ -699,24 +973,11 @@ def main_app():
                     
                     if content:
                         st.success("✅ Content generated with Hugging Face")
-                        st.markdown("**LinkedIn Post:**")
-                        st.code(content, language="")
-                        
-                        # Copy button
-                        st.markdown("**Copy to clipboard:**")
-                        st.text_area("", value=content, height=150)
+                        render_post(content, "**LinkedIn Post:**")
                     else:
                         st.warning("⚠️ Content generation failed - showing cached example")
                         # Fallback to cached
-                        cached_examples = load_cached_examples()
-                        example_key = topic if topic in cached_examples else list(cached_examples.keys())[0]
-                        example = cached_examples[example_key]
-                        fallback_content = example["content"]
-                        st.code(fallback_content, language="")
-                        
-                        # Copy button for fallback
-                        st.markdown("**Copy to clipboard:**")
-                        st.text_area("Generated Content", value=fallback_content, height=150, label_visibility="collapsed")
+                        render_post(find_cached_example(topic)["content"])
     
     # Footer
     st.markdown("---")